@@ -3,6 +3,7 @@
 # ----------------------------------------------------------------------------
 """ Module to call Swap contract """
 import asyncio
+import logging
 import time
 from enum import Enum
 from typing import Tuple
@@ -34,6 +35,7 @@ from .friktion_anchor.instructions import create, exec, exec_msg
 from .friktion_anchor.program_id import PROGRAM_ID
 from .swap_order_template import SwapOrderTemplate
 
+logger = logging.getLogger(__name__)
 
 GLOBAL_FRIKTION_AUTHORITY = PublicKey("7wYqGsQmfVigMSratssoPddfLU1P5srZcM32nvKAgWkj")
 
@@ -124,7 +126,7 @@ class SwapContract:
             raise Exception(
                 'can only get otoken details on an offer associated with an existin swap order'
             )
-        print('swap order address = ', offer.swapOrderAddress)
+        logger.debug("swap order address: %s", offer.swapOrderAddress)
         swap_order = await self.get_swap_order_for_key(offer.swapOrderAddress)
         options_contract = await self.get_options_contract_for_key(swap_order.options_contract)
         ul_factor = await self._get_token_norm_factor(options_contract.underlying_mint)
@@ -203,7 +205,7 @@ class SwapContract:
         """
 
         acc = await self.get_swap_order(user, order_id)
-        print('acc = ', acc)
+        logger.debug("swap order account: %r", acc)
         return Offer.from_swap_order(acc, find_swap_order_address(user, order_id)[0])
 
     async def validate_bid(self, bid_details: BidDetails) -> dict:
@@ -302,9 +304,9 @@ class SwapContract:
 
         provider = Provider(client, wallet)
 
-        print('sending create tx...')
+        logger.debug("sending create tx...")
         tx_resp = await provider.send(tx, [])
-        print(tx_resp)
+        logger.debug("tx response: %r", tx_resp)
 
         await client.confirm_transaction(tx_resp)
 
@@ -372,11 +374,11 @@ class SwapContract:
 
         provider = Provider(client, wallet)
 
-        print('sending exec MSG tx...')
+        logger.debug("sending exec MSG tx...")
 
         tx_resp = await provider.send(tx, [])
 
-        print(tx_resp)
+        logger.debug("tx response: %r", tx_resp)
 
         await client.confirm_transaction(tx_resp)
         await client.close()
@@ -433,11 +435,11 @@ class SwapContract:
 
         provider = Provider(client, wallet)
 
-        print('sending exec tx...')
+        logger.debug("sending exec tx...")
 
         tx_resp = await provider.send(tx, [])
 
-        print(tx_resp)
+        logger.debug("tx response: %r", tx_resp)
 
         await client.confirm_transaction(tx_resp)
         await client.close()
@@ -485,9 +487,9 @@ class SwapContract:
 
         provider = Provider(client, creator_wallet)
 
-        print('sending claim tx...')
+        logger.debug("sending claim tx...")
         tx_resp = await provider.send(tx, [])
-        print(tx_resp)
+        logger.debug("tx response: %r", tx_resp)
 
         await client.confirm_transaction(tx_resp)
 
@@ -523,9 +525,9 @@ class SwapContract:
 
         provider = Provider(client, wallet)
 
-        print('sending cancel tx...')
+        logger.debug("sending cancel tx...")
         tx_resp = await provider.send(tx, [])
-        print(tx_resp)
+        logger.debug("tx response: %r", tx_resp)
 
         await client.confirm_transaction(tx_resp)
         await client.close()
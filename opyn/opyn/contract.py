@@ -14,12 +14,24 @@
 import json
 from pathlib import Path
 
-from web3 import Web3
+from web3 import AsyncHTTPProvider, Web3
+from web3._utils.request import make_post_request
+from web3.eth import AsyncEth
 
 from opyn.chains import Chains
 from opyn.definitions import ContractConfig
 from opyn.utils import get_address
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    json_loads = json.loads
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+MAX_BATCH_SIZE = 20
+
 
 # ---------------------------------------------------------------------------
 # Contract Connection
@@ -37,6 +49,7 @@ class ContractConnection:
         abi (dict): Contract ABI
         w3 (object): RPC connection instance
         contract (object): Contract instance
+        async_contract (object): Contract instance bound to an async RPC connection
     """
 
     abi_location = "abis/Settlement.json"
@@ -69,4 +82,77 @@ class ContractConnection:
         with open(self.abi_file_path) as f:
             abi = json.load(f)
 
+        self.abi = abi
         self.contract = self.w3.eth.contract(self.address, abi=abi)
+        self._async_contract = None
+
+    @property
+    def async_contract(self):
+        """
+        Contract instance bound to an async RPC connection, created on first use
+        so sync-only callers never open the async provider
+
+        Returns:
+            contract (object): Async contract instance
+        """
+        if self._async_contract is None:
+            async_w3 = Web3(
+                AsyncHTTPProvider(self.config.rpc_uri),
+                modules={"eth": (AsyncEth,)},
+                middlewares=[],
+            )
+            self._async_contract = async_w3.eth.contract(self.address, abi=self.abi)
+        return self._async_contract
+
+    def batch_call(self, calls: list) -> list:
+        """
+        Run read-only contract calls through JSON-RPC batches, one request per
+        MAX_BATCH_SIZE calls
+
+        Args:
+            calls (list): List of (function name, arguments) tuples
+
+        Raises:
+            ValueError: The RPC rejected the batch or returned an error for one of the calls
+
+        Returns:
+            results (list): Raw hex results, in the same order as calls
+        """
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "eth_call",
+                "params": [
+                    {"to": self.address, "data": self.contract.encodeABI(fn_name=name, args=args)},
+                    "latest",
+                ],
+            }
+            for i, (name, args) in enumerate(calls)
+        ]
+
+        # Goes through web3's keep-alive session for this endpoint
+        request_kwargs = self.w3.provider.get_request_kwargs()
+        responses = {}
+        for start in range(0, len(payload), MAX_BATCH_SIZE):
+            content = make_post_request(
+                self.config.rpc_uri,
+                json.dumps(payload[start : start + MAX_BATCH_SIZE]),
+                **request_kwargs,
+            )
+            data = json_loads(content)
+            # A rejected batch comes back as a single error object, not an array
+            if isinstance(data, dict):
+                raise ValueError(f'RPC batch error: {data.get("error", data)}')
+            responses.update({item["id"]: item for item in data})
+
+        results = []
+        for i, (name, _) in enumerate(calls):
+            item = responses.get(i)
+            if item is None:
+                raise ValueError(f'RPC response missing for {name}')
+            if "error" in item:
+                raise ValueError(f'RPC error on {name}: {item["error"]}')
+            results.append(item["result"])
+
+        return results
@@ -25,6 +25,8 @@ class Domain:
     Domain parameters for signatures
     """
 
+    __slots__ = ("name", "version", "chainId", "verifyingContract")
+
     name: str
     version: str
     chainId: int
@@ -35,6 +37,18 @@ class Domain:
 class MessageToSign:
     """Bid message to sign off-chain"""
 
+    __slots__ = (
+        "offerId",
+        "bidId",
+        "signerAddress",
+        "bidderAddress",
+        "bidToken",
+        "offerToken",
+        "bidAmount",
+        "sellAmount",
+        "nonce",
+    )
+
     offerId: int
     bidId: int
     signerAddress: str
@@ -50,6 +64,20 @@ class MessageToSign:
 class BidData:
     """Bid data to send on-chain containing bid information and signature"""
 
+    __slots__ = (
+        "offerId",
+        "bidId",
+        "signerAddress",
+        "bidderAddress",
+        "bidToken",
+        "offerToken",
+        "bidAmount",
+        "sellAmount",
+        "v",
+        "r",
+        "s",
+    )
+
     offerId: int
     bidId: int
     signerAddress: str
@@ -81,3 +109,13 @@ class Offer:
     minPrice: int
     minBidSize: int
     totalSize: int
+
+
+@dataclass
+class PreparedSettlement:
+    """Wallet token state fetched ahead of a settlement"""
+
+    token: str
+    decimals: int
+    allowance: int
+    balance: int
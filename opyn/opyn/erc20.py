@@ -75,6 +75,48 @@ class ERC20Contract(ContractConnection):
 
         return response
 
+    async def async_get_allowance(self, owner: str, spender: str) -> int:
+        """
+        Async version of get_allowance
+
+        Args:
+            owner (str): Address of owner's address e.g. user wallet address
+            spender (str): Address of spender's address e.g. the Swap contract
+
+        Raises:
+            ValueError: Address of wallet is invalid
+
+        Returns:
+            allowance (int): Amount owner approved for spender to use
+        """
+        owner_address = get_address(owner)
+        spender_address = get_address(spender)
+
+        response = await self.async_contract.functions.allowance(
+            owner_address, spender_address
+        ).call()
+
+        return response
+
+    async def async_get_balance(self, owner: str) -> int:
+        """
+        Async version of get_balance
+
+        Args:
+            owner (str): Address of owner's address e.g. user wallet address
+
+        Raises:
+            ValueError: Address of wallet is invalid
+
+        Returns:
+            balance (int): Owner's balance
+        """
+        owner_address = get_address(owner)
+
+        response = await self.async_contract.functions.balanceOf(owner_address).call()
+
+        return response
+
     def approve(self, publicKey: str, privateKey: str, spender: str, amount: int):
         nonce = self.w3.eth.get_transaction_count(publicKey)
         tx = self.contract.functions.approve(get_address(spender), amount).buildTransaction(
@@ -8,6 +8,7 @@
 """ Utility functions for encode.py """
 # ---------------------------------------------------------------------------
 
+from functools import lru_cache
 
 from web3 import Web3
 
@@ -34,9 +35,10 @@ def id(text: str) -> str:
     return Web3.keccak(text=text).hex()
 
 
+@lru_cache(maxsize=4096)
 def get_address(address: str) -> str:
     """
-    Validate address validity and return the checksum address
+    Validate address validity and return the checksum address, memoized per input
 
     Args:
         address (str): Address with 0x prefix
@@ -8,7 +8,10 @@
 """ Module for wallet utilities """
 # ---------------------------------------------------------------------------
 
-from dataclasses import asdict
+import asyncio
+from dataclasses import fields
+from functools import lru_cache
+from typing import Tuple
 
 # ---------------------------------------------------------------------------
 # Imports
@@ -17,7 +20,8 @@ import eth_keys
 from py_eth_sig_utils.signing import sign_typed_data
 from web3 import Web3
 
-from opyn.definitions import BidData, ContractConfig, Domain, MessageToSign
+from opyn.chains import Chains
+from opyn.definitions import BidData, ContractConfig, Domain, MessageToSign, PreparedSettlement
 from opyn.erc20 import ERC20Contract
 from opyn.utils import get_address
 
@@ -44,6 +48,68 @@ RFQ_TYPES = {
     ],
 }
 MIN_ALLOWANCE = 100000000
+INVALID_PRIVATE_KEY = "Invalid private key: expected 32 bytes in hex format"
+
+
+# ---------------------------------------------------------------------------
+# Helper Functions
+# ---------------------------------------------------------------------------
+def _parse_private_key(private_key: str) -> bytes:
+    """
+    Validate the private key once and convert it to raw bytes
+
+    Args:
+        private_key (str): Private key in hex format, with or without 0x prefix
+
+    Raises:
+        ValueError: Private key is not 32 bytes in hex format
+
+    Returns:
+        priv_bytes (bytes): Raw 32 bytes private key
+    """
+    pk_hex = private_key[2:] if private_key[:2].lower() == "0x" else private_key
+    if len(pk_hex) != 64:
+        raise ValueError(INVALID_PRIVATE_KEY)
+    try:
+        return bytes.fromhex(pk_hex)
+    except ValueError:
+        raise ValueError(INVALID_PRIVATE_KEY) from None
+
+
+@lru_cache(maxsize=32)
+def _signer_from_priv(priv_bytes: bytes) -> Tuple[eth_keys.keys.PrivateKey, str]:
+    """
+    Build the signer and derive its checksum address, cached per private key
+
+    Args:
+        priv_bytes (bytes): Raw 32 bytes private key
+
+    Returns:
+        signer (tuple): Instance of signer and its checksum address
+    """
+    signer = eth_keys.keys.PrivateKey(priv_bytes)
+    return signer, get_address(signer.public_key.to_address())
+
+
+def _erc20(rpc_uri: str, chain_id: Chains, token_address: str) -> ERC20Contract:
+    """
+    Get the ERC20 contract connection, cached per token so the RPC handshake and
+    the ABI parsing happen once
+
+    Args:
+        rpc_uri (str): RPC endpoint
+        chain_id (Chains): Chain of the token
+        token_address (str): Address of token, in any letter case
+
+    Returns:
+        token (ERC20Contract): Connection to the token contract
+    """
+    return _cached_erc20(rpc_uri, chain_id, get_address(token_address))
+
+
+@lru_cache(maxsize=128)
+def _cached_erc20(rpc_uri: str, chain_id: Chains, token_address: str) -> ERC20Contract:
+    return ERC20Contract(ContractConfig(address=token_address, rpc_uri=rpc_uri, chain_id=chain_id))
 
 
 # ---------------------------------------------------------------------------
@@ -55,10 +121,11 @@ class Wallet:
 
     Args:
         public_key (str): Public key of the user in hex format with 0x prefix
-        private_key (str): Private key of the user in hex format with 0x prefix
+        private_key (str): Private key of the user in hex format, 0x prefix optional
 
     Attributes:
         signer (object): Instance of signer to generate signature
+        _priv_bytes (bytes): Raw private key
     """
 
     def __init__(self, public_key: str = None, private_key: str = None):
@@ -67,11 +134,13 @@ class Wallet:
 
         self.private_key = private_key
         self.public_key = public_key
+        self._priv_bytes = None
 
         if self.private_key:
-            self.signer = eth_keys.keys.PrivateKey(bytes.fromhex(self.private_key[2:]))
+            self._priv_bytes = _parse_private_key(self.private_key)
+            self.signer, address = _signer_from_priv(self._priv_bytes)
             if not self.public_key:
-                self.public_key = get_address(self.signer.public_key.to_address())
+                self.public_key = address
 
     def sign_bid_data(
         self, domain: Domain, message_to_sign: MessageToSign, types: dict = RFQ_TYPES
@@ -105,11 +174,11 @@ class Wallet:
 
         data = {
             "types": types,
-            "domain": asdict(domain),
+            "domain": {f.name: getattr(domain, f.name) for f in fields(domain)},
             "primaryType": "RFQ",
-            "message": asdict(message_to_sign),
+            "message": {f.name: getattr(message_to_sign, f.name) for f in fields(message_to_sign)},
         }
-        signature = sign_typed_data(data, Web3.toBytes(hexstr=self.private_key))
+        signature = sign_typed_data(data, self._priv_bytes)
 
         return BidData(
             offerId=message_to_sign.offerId,
@@ -135,12 +204,7 @@ class Wallet:
         Returns:
             verified (bool): True if wallet has sufficient allowance
         """
-        token_config = ContractConfig(
-            address=token_address,
-            rpc_uri=settlement_config.rpc_uri,
-            chain_id=settlement_config.chain_id,
-        )
-        token = ERC20Contract(token_config)
+        token = _erc20(settlement_config.rpc_uri, settlement_config.chain_id, token_address)
 
         allowance = (
             token.get_allowance(self.public_key, settlement_config.address) / token.decimals
@@ -148,6 +212,87 @@ class Wallet:
 
         return allowance > MIN_ALLOWANCE
 
+    def prepare_settle(
+        self, settlement_config: ContractConfig, token_address: str
+    ) -> PreparedSettlement:
+        """Fetch wallet's allowance and balance for a given token in a single RPC batch
+
+        Args:
+            settlement_config (ContractConfig): Configuration to setup the Settlement contract
+            token_address (str): Address of token
+
+        Returns:
+            prepared (PreparedSettlement): Token allowance and balance of the wallet
+        """
+        token = _erc20(settlement_config.rpc_uri, settlement_config.chain_id, token_address)
+
+        owner = get_address(self.public_key)
+
+        allowance, balance = token.batch_call(
+            [
+                ("allowance", [owner, get_address(settlement_config.address)]),
+                ("balanceOf", [owner]),
+            ]
+        )
+
+        return PreparedSettlement(
+            token=token.address,
+            decimals=token.decimals,
+            allowance=int(allowance, 16),
+            balance=int(balance, 16),
+        )
+
+    async def prepare_settle_async(
+        self, settlement_config: ContractConfig, token_address: str
+    ) -> PreparedSettlement:
+        """Fetch wallet's allowance and balance for a given token concurrently.
+        Preferred over prepare_settle for callers already running an event loop.
+
+        The token connection is built in the default executor since its setup makes
+        blocking RPC calls. web3 caches its aiohttp session per endpoint for the whole
+        process, bound to the loop that created it: run every call on the same
+        long-lived loop, a second asyncio.run fails with "Event loop is closed".
+
+        Args:
+            settlement_config (ContractConfig): Configuration to setup the Settlement contract
+            token_address (str): Address of token
+
+        Returns:
+            prepared (PreparedSettlement): Token allowance and balance of the wallet
+        """
+        token = await asyncio.get_running_loop().run_in_executor(
+            None, _erc20, settlement_config.rpc_uri, settlement_config.chain_id, token_address
+        )
+
+        allowance, balance = await asyncio.gather(
+            token.async_get_allowance(self.public_key, settlement_config.address),
+            token.async_get_balance(self.public_key),
+        )
+
+        return PreparedSettlement(
+            token=token.address,
+            decimals=token.decimals,
+            allowance=allowance,
+            balance=balance,
+        )
+
+    async def verify_allowance_async(
+        self, settlement_config: ContractConfig, token_address: str
+    ) -> bool:
+        """Async version of verify_allowance built on prepare_settle_async,
+        see its notes about the event loop
+
+        Args:
+            settlement_config (ContractConfig): Configuration to setup the Settlement contract
+            token_address (str): Address of token
+
+        Returns:
+            verified (bool): True if wallet has sufficient allowance
+        """
+        prepared = await self.prepare_settle_async(settlement_config, token_address)
+
+        return prepared.allowance / prepared.decimals > MIN_ALLOWANCE
+
     def allow_more(self, settlement_config: ContractConfig, token_address: str, amount: int):
         """Increase settlement contract allowance
 
@@ -156,11 +301,6 @@ class Wallet:
             token_address (str): Address of token to increase allowance of
             amount (str): Amount to increase allowance to
         """
-        token_config = ContractConfig(
-            address=token_address,
-            rpc_uri=settlement_config.rpc_uri,
-            chain_id=settlement_config.chain_id,
-        )
-        token = ERC20Contract(token_config)
+        token = _erc20(settlement_config.rpc_uri, settlement_config.chain_id, token_address)
 
         token.approve(self.public_key, self.private_key, settlement_config.address, amount)
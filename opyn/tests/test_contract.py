@@ -0,0 +1,89 @@
+import json
+from unittest import mock
+
+import pytest
+
+from opyn import contract
+from opyn.contract import ContractConnection
+
+
+def stub_connection(responses):
+    connection = ContractConnection.__new__(ContractConnection)
+    connection.config = mock.Mock(rpc_uri="http://rpc")
+    connection.address = "0x0000000000000000000000000000000000000001"
+    connection.contract = mock.Mock()
+    connection.contract.encodeABI.return_value = "0x"
+    connection.w3 = mock.Mock()
+    connection.w3.provider.get_request_kwargs.return_value = {}
+
+    post = mock.Mock(side_effect=[json.dumps(data).encode() for data in responses])
+    return connection, post
+
+
+def test_batch_call_matches_results_by_id():
+    connection, post = stub_connection(
+        [
+            [
+                {"jsonrpc": "2.0", "id": 1, "result": "0x02"},
+                {"jsonrpc": "2.0", "id": 0, "result": "0x01"},
+            ]
+        ]
+    )
+
+    with mock.patch.object(contract, "make_post_request", post):
+        results = connection.batch_call([("allowance", []), ("balanceOf", [])])
+
+    assert results == ["0x01", "0x02"]
+
+
+def test_batch_call_splits_large_batches():
+    calls = [("balanceOf", [])] * (contract.MAX_BATCH_SIZE + 1)
+    connection, post = stub_connection(
+        [
+            [{"id": i, "result": hex(i)} for i in range(contract.MAX_BATCH_SIZE)],
+            [{"id": contract.MAX_BATCH_SIZE, "result": "0x0"}],
+        ]
+    )
+
+    with mock.patch.object(contract, "make_post_request", post):
+        results = connection.batch_call(calls)
+
+    assert post.call_count == 2
+    assert len(results) == len(calls)
+
+
+def test_batch_call_rejected_batch():
+    connection, post = stub_connection(
+        [{"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid request"}}]
+    )
+
+    with mock.patch.object(contract, "make_post_request", post):
+        with pytest.raises(ValueError, match="RPC batch error"):
+            connection.batch_call([("balanceOf", [])])
+
+
+def test_batch_call_missing_response():
+    connection, post = stub_connection([[{"jsonrpc": "2.0", "id": 0, "result": "0x01"}]])
+
+    with mock.patch.object(contract, "make_post_request", post):
+        with pytest.raises(ValueError, match="RPC response missing for balanceOf"):
+            connection.batch_call([("allowance", []), ("balanceOf", [])])
+
+
+def test_batch_call_item_error():
+    connection, post = stub_connection(
+        [
+            [
+                {"jsonrpc": "2.0", "id": 0, "result": "0x01"},
+                {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "error": {"code": -32000, "message": "execution reverted"},
+                },
+            ]
+        ]
+    )
+
+    with mock.patch.object(contract, "make_post_request", post):
+        with pytest.raises(ValueError, match="RPC error on balanceOf"):
+            connection.batch_call([("allowance", []), ("balanceOf", [])])
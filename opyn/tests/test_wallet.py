@@ -0,0 +1,101 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from opyn import wallet
+from opyn.chains import Chains
+from opyn.definitions import ContractConfig, PreparedSettlement
+from opyn.wallet import Wallet
+
+PRIVATE_KEY = "0x" + "11" * 32
+OWNER = "0x19E7E376E7C213B7E7e7e46cc70A5dD086DAff2A"
+SETTLEMENT = "0xc18DAA3DBE4B0F0810c8A4EeABc225713313204e"
+TOKEN = "0xa4222f78d23593e82Aa74742d25D06720DCa4ab7"
+
+
+def stub_token():
+    token = mock.Mock(address=TOKEN, decimals=6)
+    token.batch_call.return_value = ["0x05f5e100", "0x0a"]
+    return token
+
+
+def test_prepare_settle_decodes_batch_results():
+    token = stub_token()
+    settlement_config = ContractConfig(SETTLEMENT, "http://rpc", Chains.ROPSTEN)
+
+    with mock.patch.object(wallet, "_erc20", return_value=token):
+        prepared = Wallet(public_key=OWNER.lower()).prepare_settle(settlement_config, TOKEN)
+
+    token.batch_call.assert_called_once_with(
+        [("allowance", [OWNER, SETTLEMENT]), ("balanceOf", [OWNER])]
+    )
+    assert prepared == PreparedSettlement(token=TOKEN, decimals=6, allowance=100000000, balance=10)
+
+
+def stub_async_token(allowance, balance):
+    token = mock.Mock(address=TOKEN, decimals=6)
+
+    async def async_get_allowance(owner, spender):
+        return allowance
+
+    async def async_get_balance(owner):
+        return balance
+
+    token.async_get_allowance.side_effect = async_get_allowance
+    token.async_get_balance.side_effect = async_get_balance
+    return token
+
+
+def test_prepare_settle_async_gathers_allowance_and_balance():
+    token = stub_async_token(100000000, 10)
+    settlement_config = ContractConfig(SETTLEMENT, "http://rpc", Chains.ROPSTEN)
+
+    with mock.patch.object(wallet, "_erc20", return_value=token) as erc20:
+        prepared = asyncio.run(
+            Wallet(public_key=OWNER).prepare_settle_async(settlement_config, TOKEN)
+        )
+
+    erc20.assert_called_once_with("http://rpc", Chains.ROPSTEN, TOKEN)
+    token.async_get_allowance.assert_called_once_with(OWNER, SETTLEMENT)
+    token.async_get_balance.assert_called_once_with(OWNER)
+    assert prepared == PreparedSettlement(token=TOKEN, decimals=6, allowance=100000000, balance=10)
+
+
+def test_verify_allowance_async():
+    settlement_config = ContractConfig(SETTLEMENT, "http://rpc", Chains.ROPSTEN)
+    owner = Wallet(public_key=OWNER)
+
+    with mock.patch.object(wallet, "_erc20", return_value=stub_async_token(10**15, 0)):
+        assert asyncio.run(owner.verify_allowance_async(settlement_config, TOKEN))
+
+    with mock.patch.object(wallet, "_erc20", return_value=stub_async_token(10**8, 0)):
+        assert not asyncio.run(owner.verify_allowance_async(settlement_config, TOKEN))
+
+
+def test_erc20_cached_per_checksum_address():
+    wallet._cached_erc20.cache_clear()
+
+    with mock.patch.object(wallet, "ERC20Contract") as contract:
+        first = wallet._erc20("http://rpc", Chains.ROPSTEN, TOKEN.lower())
+        second = wallet._erc20("http://rpc", Chains.ROPSTEN, TOKEN.upper().replace("0X", "0x"))
+
+    assert first is second
+    contract.assert_called_once()
+    assert contract.call_args.args[0].address == TOKEN
+    wallet._cached_erc20.cache_clear()
+
+
+def test_private_key_prefix_is_optional():
+    public_key = Wallet(private_key=PRIVATE_KEY).public_key
+
+    assert Wallet(private_key=PRIVATE_KEY[2:]).public_key == public_key
+    assert Wallet(private_key="0X" + PRIVATE_KEY[2:]).public_key == public_key
+
+
+@pytest.mark.parametrize(
+    "private_key", [PRIVATE_KEY[:-2], PRIVATE_KEY + "11", "0x" + "zz" * 32, "zz" * 32]
+)
+def test_invalid_private_key(private_key):
+    with pytest.raises(ValueError, match="Invalid private key"):
+        Wallet(private_key=private_key)
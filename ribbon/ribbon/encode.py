@@ -15,7 +15,15 @@ import re
 # ---------------------------------------------------------------------------
 from web3 import Web3
 
-from ribbon.utils import encode_type, get_address, hex_concat, hex_pad_right, hex_zero_pad, id
+from ribbon.utils import (
+    encode_type,
+    get_address,
+    hex_concat,
+    hex_pad_right,
+    hex_zero_pad,
+    id,
+    keccak256,
+)
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -74,14 +82,14 @@ def bytes_encoder(type: str) -> object:
         encoder (object): Bytes encoder
     """
     match = re.findall('^bytes(\d+)$', type).pop()
-    width = int(match[1])
+    width = int(match)
 
-    if width == 0 or width > 32 or match[1] != str(width):
+    if width == 0 or width > 32 or match != str(width):
         raise ValueError(f'Invalid bytes width: {type}')
 
     return (
         lambda value: hex_pad_right(value)
-        if len(value) == width
+        if len(value) == 2 + 2 * width
         else ValueError('Invalid bytes length')
     )
 
@@ -219,7 +227,6 @@ class TypedDataEncoder:
             subtype = match[0]
             subEncoder = self.get_encoder(subtype)
             length = 0 if len(match) == 1 else int(match[1])
-            print(length)
             return (
                 lambda values: Web3.keccak(
                     text=hex_concat(
@@ -261,6 +268,7 @@ class TypedDataEncoder:
             return self._encoderCache[type]
         else:
             encoder = self._get_encoder(type)
+            self._encoderCache[type] = encoder
 
         return encoder
 
@@ -288,7 +296,20 @@ class TypedDataEncoder:
         Returns:
             hash (str): Hash of encoded data
         """
-        return Web3.keccak(hexstr=self.encode_data(name, value)).hex()
+        return '0x' + self.hash_struct_bytes(name, value).hex()
+
+    def hash_struct_bytes(self, name: str, value: dict) -> bytes:
+        """
+        Same as hash_struct but returning the raw 32 bytes hash
+
+        Args:
+            name (str): Data type in string
+            value (dict): Values corresponding to the type
+
+        Returns:
+            hash (bytes): Hash of encoded data
+        """
+        return keccak256(bytes.fromhex(self.encode_data(name, value)[2:]))
 
     def hash(self, value: dict) -> str:
         """
@@ -389,4 +410,7 @@ class TypedDataEncoder:
         Returns:
             hash (str): Hash of message
         """
-        return Web3.keccak(hexstr=TypedDataEncoder.encode(domain, types, value)).hex()
+        return (
+            '0x'
+            + keccak256(bytes.fromhex(TypedDataEncoder.encode(domain, types, value)[2:])).hex()
+        )
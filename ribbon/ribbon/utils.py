@@ -9,10 +9,12 @@
 # ---------------------------------------------------------------------------
 
 import re
+from functools import lru_cache
 
 # ---------------------------------------------------------------------------
 # Imports
 # ---------------------------------------------------------------------------
+from eth_utils import keccak
 from web3 import Web3
 
 # ---------------------------------------------------------------------------
@@ -24,6 +26,19 @@ PADDING = bytearray([0] * 32)
 # ---------------------------------------------------------------------------
 # Utilities
 # ---------------------------------------------------------------------------
+def keccak256(data: bytes) -> bytes:
+    """
+    Generate the keccak256 of raw bytes, without going through hex strings
+
+    Args:
+        data (bytes): Bytes to hash
+
+    Returns:
+        hash (bytes): Resulting 32 bytes hash
+    """
+    return keccak(data)
+
+
 def id(text: str) -> str:
     """
     Generate the keccak256 of a string
@@ -34,12 +49,13 @@ def id(text: str) -> str:
     Returns:
         hash (str): Resulting hash
     """
-    return Web3.keccak(text=text).hex()
+    return '0x' + keccak256(text.encode('utf-8')).hex()
 
 
+@lru_cache(maxsize=4096)
 def get_address(address: str) -> str:
     """
-    Validate address validity and return the checksum address
+    Validate address validity and return the checksum address, memoized per input
 
     Args:
         address (str): Address with 0x prefix
@@ -120,9 +136,9 @@ def hex_pad_right(value: str) -> str:
     Returns:
         hex (object): Hex with padding
     """
-    padOffset = len(value) % 32
+    padOffset = (len(value) - 2) // 2 % 32
     if padOffset > 0:
-        return hex_concat([value, PADDING.hex()[padOffset:]])
+        return hex_concat([value, PADDING[padOffset:].hex()])
     return value
 
 
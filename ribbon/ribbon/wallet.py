@@ -8,17 +8,27 @@
 """ Module for wallet utilities """
 # ---------------------------------------------------------------------------
 
-from dataclasses import asdict
+from dataclasses import fields
+from functools import lru_cache
+from typing import Tuple
 
 # ---------------------------------------------------------------------------
 # Imports
 # ---------------------------------------------------------------------------
 import eth_keys
 
+try:
+    import coincurve
+
+    COINCURVE_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    COINCURVE_AVAILABLE = False
+
+from ribbon.chains import Chains
 from ribbon.definitions import Bid, ContractConfig, Domain, SignedBid
 from ribbon.encode import TypedDataEncoder
 from ribbon.erc20 import ERC20Contract
-from ribbon.utils import get_address, hex_zero_pad
+from ribbon.utils import get_address, keccak256
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -34,6 +44,118 @@ BID_TYPES = {
     ]
 }
 MIN_ALLOWANCE = 100000000
+INVALID_PRIVATE_KEY = "Invalid private key: expected 32 bytes in hex format"
+
+# Built once at import: the Bid type hash is computed here instead of per signature
+_BID_ENCODER = TypedDataEncoder(BID_TYPES)
+_BID_ENCODER.get_encoder(_BID_ENCODER.primaryType)
+
+
+# ---------------------------------------------------------------------------
+# Helper Functions
+# ---------------------------------------------------------------------------
+def _parse_private_key(private_key: str) -> bytes:
+    """
+    Validate the private key once and convert it to raw bytes
+
+    Args:
+        private_key (str): Private key in hex format, with or without 0x prefix
+
+    Raises:
+        ValueError: Private key is not 32 bytes in hex format
+
+    Returns:
+        priv_bytes (bytes): Raw 32 bytes private key
+    """
+    pk_hex = private_key[2:] if private_key[:2].lower() == "0x" else private_key
+    if len(pk_hex) != 64:
+        raise ValueError(INVALID_PRIVATE_KEY)
+    try:
+        return bytes.fromhex(pk_hex)
+    except ValueError:
+        raise ValueError(INVALID_PRIVATE_KEY) from None
+
+
+@lru_cache(maxsize=32)
+def _signer_from_priv(priv_bytes: bytes) -> Tuple[eth_keys.keys.PrivateKey, str, object]:
+    """
+    Build the signers and derive the checksum address, cached per private key
+
+    Args:
+        priv_bytes (bytes): Raw 32 bytes private key
+
+    Returns:
+        signer (tuple): Instance of signer, its checksum address and the
+          libsecp256k1 signer (None when coincurve is not installed)
+    """
+    signer = eth_keys.keys.PrivateKey(priv_bytes)
+    cc_signer = coincurve.PrivateKey(priv_bytes) if COINCURVE_AVAILABLE else None
+    return signer, get_address(signer.public_key.to_address()), cc_signer
+
+
+def _encoder_for(types: dict) -> TypedDataEncoder:
+    """
+    Get the typed data encoder, reusing the prebuilt one for the default Bid types
+
+    Args:
+        types (dict): Dictionary of types and their fields
+
+    Returns:
+        encoder (TypedDataEncoder): Encoder for types
+    """
+    if types is BID_TYPES:
+        return _BID_ENCODER
+    return TypedDataEncoder._from(types)
+
+
+def _erc20(rpc_uri: str, chain_id: Chains, token_address: str) -> ERC20Contract:
+    """
+    Get the ERC20 contract connection, cached per token so the RPC handshake and
+    the ABI parsing happen once
+
+    Args:
+        rpc_uri (str): RPC endpoint
+        chain_id (Chains): Chain of the token
+        token_address (str): Address of token, in any letter case
+
+    Returns:
+        token (ERC20Contract): Connection to the token contract
+    """
+    return _cached_erc20(rpc_uri, chain_id, get_address(token_address))
+
+
+@lru_cache(maxsize=128)
+def _cached_erc20(rpc_uri: str, chain_id: Chains, token_address: str) -> ERC20Contract:
+    return ERC20Contract(ContractConfig(address=token_address, rpc_uri=rpc_uri, chain_id=chain_id))
+
+
+@lru_cache(maxsize=8)
+def _domain_separator(
+    name: str, version: str, chain_id: int, verifying_contract: str, salt: str = None
+) -> bytes:
+    """
+    Hash the EIP712 domain, cached since it is constant across the bids of a swap
+
+    Args:
+        name (str): Domain name
+        version (str): Domain version
+        chain_id (int): Chain ID
+        verifying_contract (str): Address of the verifying contract
+        salt (str) (optional): Domain salt
+
+    Returns:
+        hash (bytes): Hash of encoded domain data
+    """
+    domain = {
+        "name": name,
+        "version": version,
+        "chainId": chain_id,
+        "verifyingContract": verifying_contract,
+        "salt": salt,
+    }
+    domain_dict = {k: v for k, v in domain.items() if v is not None}
+
+    return bytes.fromhex(TypedDataEncoder.hash_domain(domain_dict)[2:])
 
 
 # ---------------------------------------------------------------------------
@@ -45,10 +167,12 @@ class Wallet:
 
     Args:
         public_key (str): Public key of the user in hex format with 0x prefix
-        private_key (str): Private key of the user in hex format with 0x prefix
+        private_key (str): Private key of the user in hex format, 0x prefix optional
 
     Attributes:
         signer (object): Instance of signer to generate signature
+        _priv_bytes (bytes): Raw private key
+        _cc_signer (object): libsecp256k1 signer, set when coincurve is installed
     """
 
     def __init__(self, public_key: str = None, private_key: str = None):
@@ -57,11 +181,14 @@ class Wallet:
 
         self.private_key = private_key
         self.public_key = public_key
+        self._priv_bytes = None
+        self._cc_signer = None
 
         if self.private_key:
-            self.signer = eth_keys.keys.PrivateKey(bytes.fromhex(self.private_key[2:]))
+            self._priv_bytes = _parse_private_key(self.private_key)
+            self.signer, address, self._cc_signer = _signer_from_priv(self._priv_bytes)
             if not self.public_key:
-                self.public_key = get_address(self.signer.public_key.to_address())
+                self.public_key = address
 
     def sign_msg(self, messageHash: str) -> dict:
         """Sign a hash message using the signer object
@@ -72,15 +199,36 @@ class Wallet:
         Returns:
             signature (dict): Signature split into v, r, s components
         """
-        signature = self.signer.sign_msg_hash(bytes.fromhex(messageHash[2:]))
+        return self.sign_msg_bytes(bytes.fromhex(messageHash[2:]))
+
+    def sign_msg_bytes(self, msg_hash: bytes) -> dict:
+        """Sign a raw 32 bytes hash message using the signer object
+
+        Args:
+            msg_hash (bytes): Message to signed
+
+        Returns:
+            signature (dict): Signature split into v, r, s components
+        """
+        if self._cc_signer is not None:
+            signature = self._cc_signer.sign_recoverable(msg_hash, hasher=None)
+            return {
+                "v": signature[64] + 27,
+                "r": '0x' + signature[:32].hex(),
+                "s": '0x' + signature[32:64].hex(),
+            }
+
+        signature = self.signer.sign_msg_hash(msg_hash)
 
         return {
             "v": signature.v + 27,
-            "r": hex_zero_pad(hex(signature.r), 32),
-            "s": hex_zero_pad(hex(signature.s), 32),
+            "r": '0x' + signature.r.to_bytes(32, 'big').hex(),
+            "s": '0x' + signature.s.to_bytes(32, 'big').hex(),
         }
 
-    def _sign_type_data_v4(self, domain: Domain, value: dict, types: dict) -> str:
+    def _sign_type_data_v4(
+        self, domain: Domain, value: dict, types: dict, encoder: TypedDataEncoder = None
+    ) -> dict:
         """Sign a hash of typed data V4 which follows EIP712 convention:
         https://eips.ethereum.org/EIPS/eip-712
 
@@ -89,6 +237,7 @@ class Wallet:
               name, version, chainId, verifyingContract and salt (optional)
             types (dict): Dictionary of types and their fields
             value (dict): Dictionary of values for each field in types
+            encoder (TypedDataEncoder) (optional): Encoder already built for types
 
         Raises:
             TypeError: Domain argument is not an instance of Domain class
@@ -99,9 +248,15 @@ class Wallet:
         if not isinstance(domain, Domain):
             raise TypeError("Invalid domain parameters")
 
-        domain_dict = {k: v for k, v in asdict(domain).items() if v is not None}
+        domain_separator = _domain_separator(
+            domain.name, domain.version, domain.chainId, domain.verifyingContract, domain.salt
+        )
+        if encoder is None:
+            encoder = TypedDataEncoder._from(types)
+        struct_hash = encoder.hash_struct_bytes(encoder.primaryType, value)
+        digest = keccak256(b"\x19\x01" + domain_separator + struct_hash)
 
-        return self.sign_msg(TypedDataEncoder._hash(domain_dict, types, value))
+        return self.sign_msg_bytes(digest)
 
     def sign_bid(self, domain: Domain, bid: Bid, types: dict = BID_TYPES) -> SignedBid:
         """Sign a bid using _sign_type_data_v4
@@ -115,6 +270,48 @@ class Wallet:
         Raises:
             TypeError: Bid argument is not an instance of Bid class
 
+        Returns:
+            signedBid (dict): Bid combined with the generated signature
+        """
+        return self._sign_bid(domain, bid, types, _encoder_for(types))
+
+    def sign_bid_batch(self, domain: Domain, bids: list, types: dict = BID_TYPES) -> list:
+        """Sign several bids for the same domain, building the typed data encoder
+        once for the whole batch when custom types are given
+
+        Args:
+            domain (dict): Dictionary containing domain parameters including
+              name, version, chainId, verifyingContract and salt (optional)
+            bids (list): List of Bid to sign
+            types (dict): Dictionary of types and their fields
+
+        Raises:
+            TypeError: One of the bids is not an instance of Bid class
+
+        Returns:
+            signedBids (list): Bids combined with their generated signature, in order
+        """
+        encoder = _encoder_for(types)
+
+        return [self._sign_bid(domain, bid, types, encoder) for bid in bids]
+
+    def _sign_bid(
+        self, domain: Domain, bid: Bid, types: dict, encoder: TypedDataEncoder
+    ) -> SignedBid:
+        """Sign a bid with an encoder already built for types, shared by sign_bid
+        and sign_bid_batch
+
+        Args:
+            domain (dict): Dictionary containing domain parameters including
+              name, version, chainId, verifyingContract and salt (optional)
+            bid (Bid): Bid specification
+            types (dict): Dictionary of types and their fields
+            encoder (TypedDataEncoder): Encoder built for types
+
+        Raises:
+            TypeError: Bid argument is not an instance of Bid class
+            ValueError: Wallet has no private key or bid signer does not match it
+
         Returns:
             signedBid (dict): Bid combined with the generated signature
         """
@@ -130,7 +327,9 @@ class Wallet:
         if signerWallet != self.public_key:
             raise ValueError("Signer wallet address mismatch")
 
-        signature = self._sign_type_data_v4(domain, asdict(bid), types)
+        signature = self._sign_type_data_v4(
+            domain, {f.name: getattr(bid, f.name) for f in fields(bid)}, types, encoder
+        )
 
         return SignedBid(
             swapId=bid.swapId,
@@ -154,12 +353,7 @@ class Wallet:
         Returns:
             verified (bool): True if wallet has sufficient allowance
         """
-        token_config = ContractConfig(
-            address=token_address,
-            rpc_uri=swap_config.rpc_uri,
-            chain_id=swap_config.chain_id,
-        )
-        bidding_token = ERC20Contract(token_config)
+        bidding_token = _erc20(swap_config.rpc_uri, swap_config.chain_id, token_address)
 
         allowance = (
             bidding_token.get_allowance(self.public_key, swap_config.address)
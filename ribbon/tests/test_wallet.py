@@ -0,0 +1,148 @@
+import os
+from dataclasses import asdict
+
+import eth_keys
+import pytest
+from eth_keys.backends import NativeECCBackend
+
+from ribbon.definitions import Bid, Domain
+from ribbon.encode import TypedDataEncoder
+from ribbon.utils import hex_zero_pad
+from ribbon.wallet import BID_TYPES, Wallet
+
+PRIVATE_KEY = '0x' + '11' * 32
+SWAP_ADDRESS = '0x58848824baEb9678847aF487CB02EAba782FECB5'
+DOMAINS = [
+    Domain(name='RIBBON SWAP', chainId=42, verifyingContract=SWAP_ADDRESS, version='1'),
+    Domain(
+        name='RIBBON SWAP',
+        chainId=42,
+        verifyingContract=SWAP_ADDRESS,
+        version='1',
+        salt='0x' + 'ab' * 32,
+    ),
+]
+
+
+def test_eth_keys_signatures_match_hex_zero_pad():
+    for _ in range(1000):
+        private_key = os.urandom(32)
+        message_hash = os.urandom(32)
+
+        wallet = Wallet(private_key='0x' + private_key.hex())
+        wallet._cc_signer = None
+
+        expected = eth_keys.keys.PrivateKey(private_key).sign_msg_hash(message_hash)
+
+        assert wallet.sign_msg('0x' + message_hash.hex()) == {
+            "v": expected.v + 27,
+            "r": hex_zero_pad(hex(expected.r), 32),
+            "s": hex_zero_pad(hex(expected.s), 32),
+        }
+
+
+def test_coincurve_signatures_match_eth_keys():
+    pytest.importorskip("coincurve")
+
+    for _ in range(1000):
+        private_key = os.urandom(32)
+        message_hash = os.urandom(32)
+
+        wallet = Wallet(private_key='0x' + private_key.hex())
+        assert wallet._cc_signer is not None
+
+        expected = eth_keys.keys.PrivateKey(private_key, backend=NativeECCBackend()).sign_msg_hash(
+            message_hash
+        )
+
+        assert wallet.sign_msg('0x' + message_hash.hex()) == {
+            "v": expected.v + 27,
+            "r": '0x' + expected.r.to_bytes(32, 'big').hex(),
+            "s": '0x' + expected.s.to_bytes(32, 'big').hex(),
+        }
+
+
+def test_domain_hash_with_salt():
+    # Reference value from eth_account.messages.encode_structured_data
+    domain = {
+        'name': 'A',
+        'version': '1',
+        'chainId': 1,
+        'verifyingContract': SWAP_ADDRESS,
+        'salt': '0x' + 'ab' * 32,
+    }
+    assert (
+        TypedDataEncoder.hash_domain(domain)
+        == '0xb615595cd9c866ae819352f3cc18ae864d45aea58994450e5fa3bb39312b61aa'
+    )
+
+
+def make_bids(wallet, count):
+    return [
+        Bid(
+            swapId=1,
+            nonce=nonce,
+            signerWallet=wallet.public_key,
+            sellAmount=6000000 + nonce,
+            buyAmount=10**18,
+        )
+        for nonce in range(count)
+    ]
+
+
+@pytest.mark.parametrize("domain", DOMAINS)
+def test_sign_type_data_v4_matches_typed_data_encoder(domain):
+    wallet = Wallet(private_key=PRIVATE_KEY)
+    domain_dict = {k: v for k, v in asdict(domain).items() if v is not None}
+
+    for bid in make_bids(wallet, 20):
+        expected = wallet.sign_msg(TypedDataEncoder._hash(domain_dict, BID_TYPES, asdict(bid)))
+
+        assert wallet._sign_type_data_v4(domain, asdict(bid), BID_TYPES) == expected
+
+        signed = wallet.sign_bid(domain, bid)
+        assert (signed.v, signed.r, signed.s) == (expected["v"], expected["r"], expected["s"])
+
+
+def test_sign_bid_batch_matches_sign_bid():
+    wallet = Wallet(private_key=PRIVATE_KEY)
+    bids = make_bids(wallet, 10)
+
+    signed = wallet.sign_bid_batch(DOMAINS[0], bids)
+
+    assert [s.nonce for s in signed] == [bid.nonce for bid in bids]
+    assert signed == [wallet.sign_bid(DOMAINS[0], bid) for bid in bids]
+
+
+def test_sign_bid_batch_custom_types():
+    wallet = Wallet(private_key=PRIVATE_KEY)
+    bids = make_bids(wallet, 3)
+    types = {"Order": BID_TYPES["Bid"]}
+
+    signed = wallet.sign_bid_batch(DOMAINS[0], bids, types)
+
+    assert signed == [wallet.sign_bid(DOMAINS[0], bid, types) for bid in bids]
+    assert signed != wallet.sign_bid_batch(DOMAINS[0], bids)
+
+
+def test_sign_bid_batch_rejects_invalid_bid():
+    wallet = Wallet(private_key=PRIVATE_KEY)
+    bids = make_bids(wallet, 2)
+
+    with pytest.raises(TypeError):
+        wallet.sign_bid_batch(DOMAINS[0], bids + [asdict(bids[0])])
+
+
+def test_private_key_prefix_is_optional():
+    public_key = Wallet(private_key=PRIVATE_KEY).public_key
+
+    assert Wallet(private_key=PRIVATE_KEY[2:]).public_key == public_key
+    assert Wallet(private_key="0X" + PRIVATE_KEY[2:]).public_key == public_key
+
+
+@pytest.mark.parametrize(
+    "private_key", [PRIVATE_KEY[:-2], PRIVATE_KEY + "11", "0x" + "zz" * 32, "zz" * 32]
+)
+def test_invalid_private_key(private_key):
+    with pytest.raises(ValueError, match="Invalid private key"):
+        Wallet(private_key=private_key)